@@ -0,0 +1,150 @@
+"""Memory and throughput benchmark for building Book records.
+
+Builds synthetic Goodreads profile and listopia rows from stub objects (no
+network or bs4 needed) and compares Book.from_page against the previous
+__dict__-based Book that computed its file paths eagerly.
+
+Usage: python benchmarks/bench_book.py [--count 100000] [--repeat 7]
+"""
+import argparse
+import gc
+import os
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.book import Book
+
+LIST_NAME = "Best Books: of the 21st Century?"
+
+
+class _Text:
+    def __init__(self, text):
+        self.text = text
+
+
+class ProfileRow:
+    def __init__(self, i):
+        self.title = _Text(f"Title {i}: A Story?\n(Series #{i % 7})")
+        self.author = _Text(f"Author{i % 500}, Jane Jr.")
+
+    def select_one(self, selector):
+        return self.title if "title" in selector else self.author
+
+
+class ListopiaRow:
+    def __init__(self, i):
+        self.spans = {
+            "name": _Text(f"Title {i}: A Story (Series #{i % 7})"),
+            "author": _Text(f"\nAuthor{i % 500}, Jane (Goodreads Author)\n"),
+        }
+
+    def find(self, tag, attrs):
+        return self.spans[attrs["itemprop"]]
+
+
+class LegacyBook:
+    """The previous Book: per-instance __dict__, eager paths, uncompiled patterns."""
+
+    parse_html = Book.parse_html
+
+    def __init__(self, book_html, website):
+        self.parse_html(book_html, website)
+
+    def set_directory(self, list_name):
+        restricted_characters = r'[\/:*?"<>|]'
+        formatted_list_name = re.sub(restricted_characters, '', list_name)
+        self.filepath = f"downloads/{formatted_list_name}/{self.filename}"
+
+    def filepath_prep(self, title, list_name):
+        restricted_characters = r'[\/\:*?"<>|]'
+        if title is None:
+            title = "no_title"
+        self.title = title
+        self.author = re.sub(restricted_characters, '', self.author)
+        safe_title = re.sub(restricted_characters, '', title)
+        self.filename = safe_title + " - " + self.author + ".epub"
+        self.attachment_name = safe_title + ".epub"
+        if list_name is not None:
+            self.set_directory(list_name)
+        else:
+            self.filepath = f"downloads/{self.filename}"
+
+
+def build_legacy(rows, website):
+    books = []
+    for book_html in rows:
+        book = LegacyBook(book_html, website)
+        book.set_directory(LIST_NAME)
+        books.append(book)
+    return books
+
+
+def build_slots(rows, website):
+    return Book.from_page(rows, website, LIST_NAME)
+
+
+# builds the records and reads every file path, as the downloader would
+def run(build, rows, website):
+    books = build(rows, website)
+    for book in books:
+        book.filepath
+        book.attachment_name
+    return books
+
+
+# times each run with the garbage collector off so collection pauses do not skew the results
+def measure(build, rows, website, repeat):
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run(build, rows, website)
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+    tracemalloc.start()
+    books = run(build, rows, website)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del books
+    return timings, current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    for website, row_class in (("profile", ProfileRow), ("listopia", ListopiaRow)):
+        rows = [row_class(i) for i in range(args.count)]
+        legacy = build_legacy(rows[:100], website)
+        slots = build_slots(rows[:100], website)
+        for old, new in zip(legacy, slots):
+            assert (old.title, old.author, old.filename, old.attachment_name, old.filepath) == \
+                   (new.title, new.author, new.filename, new.attachment_name, new.filepath)
+
+        print(f"{website}: {args.count} rows")
+        results = {}
+        for label, build in (("__dict__ baseline", build_legacy), ("__slots__ from_page", build_slots)):
+            timings, retained, peak = measure(build, rows, website, args.repeat)
+            results[label] = timings
+            print(f"  {label:<20} median {statistics.median(timings):6.3f}s "
+                  f"(range {min(timings):.3f}-{max(timings):.3f}s)  "
+                  f"{args.count / statistics.median(timings):>10,.0f} books/s  "
+                  f"retained {retained / 1e6:6.1f} MB  peak {peak / 1e6:6.1f} MB")
+        baseline, slots = results["__dict__ baseline"], results["__slots__ from_page"]
+        print(f"  speedup median {statistics.median(baseline) / statistics.median(slots):.2f}x "
+              f"(range {min(baseline) / max(slots):.2f}x-{max(baseline) / min(slots):.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -78,10 +78,7 @@ class GoodreadsList(Scraper):
                     break
                 if books_remaining < 10:
                     book_list = book_list[:books_remaining]
-                for book_html in book_list:
-                    goodreads_book = Book(book_html, "profile")
-                    goodreads_book.set_directory(self.list_name)
-                    goodreads_books.append(goodreads_book)
+                goodreads_books.extend(Book.from_page(book_list, "profile", self.list_name))
                 books_remaining -= len(book_list)
                 page += 1
                 separator = "&" if "?" in list_url else "?"
@@ -105,10 +102,7 @@ class GoodreadsList(Scraper):
                 book_list = soup.find_all("tr")
                 if books_remaining < 100:
                     book_list = book_list[:books_remaining]
-                for book_html in book_list:
-                    goodreads_book = Book(book_html, "listopia")
-                    goodreads_book.set_directory(self.list_name)
-                    goodreads_books.append(goodreads_book)
+                goodreads_books.extend(Book.from_page(book_list, "listopia", self.list_name))
                 books_remaining -= len(book_list)
                 page += 1
                 url_with_attrs = list_url + f"&page={page}"
@@ -144,8 +138,7 @@ class GoodreadsList(Scraper):
                     if entry_number_float % 1 == 0: #determine if main series entry
                         if entry_number_float != 0:
                             main_series_count += 1
-                        goodreads_book = Book(book_html, "series")
-                        goodreads_book.set_directory(self.list_name)
+                        goodreads_book = Book(book_html, "series", self.list_name)
                         goodreads_books.append(goodreads_book)
                         
             
@@ -1,30 +1,74 @@
 import re
 
+# characters that are not allowed in file and directory names
+RESTRICTED_CHARACTERS = re.compile(r'[\/\:*?"<>|]')
+
 class Book:
-    def __init__(self, book_html, website):
+    # author is only sanitised by filepath_prep, so change it through filepath_prep / update_metadata
+    __slots__ = ("_title", "_safe_title", "author", "md5", "language", "size", "genre",
+                 "_safe_list_name")
+
+    def __init__(self, book_html, website, list_name=None):
+        self._safe_list_name = None
         self.parse_html(book_html, website)
+        if list_name is not None:
+            self.set_directory(list_name)
+
+    # builds books for every entry of a parsed page, all sharing the same list directory
+    @classmethod
+    def from_page(cls, book_htmls, website, list_name=None):
+        safe_list_name = None
+        if list_name is not None:
+            safe_list_name = RESTRICTED_CHARACTERS.sub('', list_name)
+        books = []
+        for book_html in book_htmls:
+            book = cls(book_html, website)
+            book._safe_list_name = safe_list_name
+            books.append(book)
+        return books
 
     def set_directory(self, list_name):
-        restricted_characters = r'[\/:*?"<>|]'
-        formatted_list_name =  re.sub(restricted_characters, '', list_name)
-        self.filepath = f"downloads/{formatted_list_name}/{self.filename}"
+        if list_name is not None:
+            list_name = RESTRICTED_CHARACTERS.sub('', list_name)
+        self._safe_list_name = list_name
 
     def filepath_prep(self, title, list_name):
-        restricted_characters = r'[\/\:*?"<>|]'
         if title is None:
             title = "no_title"
         # Do not remove slashes from title for metadata/search
         self.title = title
-        temp_author = re.sub(restricted_characters, '', self.author)
-        self.author = temp_author
-        # Remove restricted characters from filename only
-        safe_title = re.sub(restricted_characters, '', title)
-        self.filename = safe_title + " - " + self.author + ".epub"
-        self.attachment_name = safe_title + ".epub"
-        if list_name is not None:
-            self.set_directory(list_name)
-        else:
-            self.filepath = f"downloads/{self.filename}"
+        self.author = RESTRICTED_CHARACTERS.sub('', self.author)
+        self.set_directory(list_name)
+
+    @property
+    def title(self):
+        return self._title
+
+    @title.setter
+    def title(self, title):
+        self._title = title
+        self._safe_title = None
+
+    # title with restricted characters removed, computed on first use
+    @property
+    def safe_title(self):
+        if self._safe_title is None:
+            self._safe_title = RESTRICTED_CHARACTERS.sub('', self._title)
+        return self._safe_title
+
+    @property
+    def filename(self):
+        return f"{self.safe_title} - {self.author}.epub"
+
+    @property
+    def attachment_name(self):
+        return f"{self.safe_title}.epub"
+
+    @property
+    def filepath(self):
+        if self._safe_list_name is None:
+            return f"downloads/{self.filename}"
+        return f"downloads/{self._safe_list_name}/{self.filename}"
 
     # parses html to determine book metadata
     def parse_html(self, book_html, website):
@@ -83,11 +127,7 @@ class Book:
 
 
 def _get_epub_index(split_metadata):
-    epub_index = 0
-    while True:
-        if "epub" in split_metadata[epub_index]:
-            break
-        epub_index += 1
-        if epub_index >= len(split_metadata):
-            raise Exception("Non-epub book found")
-    return epub_index
+    for epub_index, field in enumerate(split_metadata):
+        if "epub" in field:
+            return epub_index
+    raise Exception("Non-epub book found")